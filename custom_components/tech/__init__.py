@@ -54,13 +54,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """
     _LOGGER.debug("Setting up component's entry")
     _LOGGER.debug("Entry id: %s", str(entry.entry_id))
-    _LOGGER.debug(
-        "Entry -> title: %s, data: %s, id: %s, domain: %s",
-        entry.title,
-        async_redact_data(dict(entry.data), ["token"]),
-        entry.entry_id,
-        entry.domain,
-    )
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        # async_redact_data copies the whole entry data, so only pay for it
+        # when the line is actually emitted.
+        _LOGGER.debug(
+            "Entry -> title: %s, data: %s, id: %s, domain: %s",
+            entry.title,
+            async_redact_data(entry.data, {CONF_TOKEN}),
+            entry.entry_id,
+            entry.domain,
+        )
     language_code = hass.config.language
     user_id = entry.data[USER_ID]
     token = entry.data[CONF_TOKEN]
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
 from typing import Any
 
@@ -17,6 +18,18 @@ from .const import (
 _LOGGER = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _fallback_txt(text_id: int) -> str:
+    """Return the shared ``txtId N`` placeholder for an untranslated id."""
+    return f"txtId {text_id}"
+
+
+@lru_cache(maxsize=1024)
+def _fallback_type(text_type: int) -> str:
+    """Return the shared ``type N`` placeholder for an unmapped tile type."""
+    return f"type {text_type}"
+
+
 class Translations:
     """Translated subtitle strings fetched from the Tech API.
 
@@ -34,7 +47,12 @@ class Translations:
                 so lookups degrade to the ``txtId ...`` fallback.
 
         """
-        self._texts: dict[str, str] = (data or {}).get("data", {})
+        # Key the catalog by int once here; callers always pass the numeric
+        # txtId from the payload, so lookups skip a str() per call.
+        texts: dict[str, str] = (data or {}).get("data", {})
+        self._texts: dict[int, str] = {
+            int(text_id): text for text_id, text in texts.items() if text_id.isdigit()
+        }
 
     @classmethod
     async def load(cls, language: str, api) -> Translations:
@@ -50,22 +68,26 @@ class Translations:
     def get_text(self, text_id: int) -> str:
         """Return the translated string for a subtitle identifier."""
         if text_id != 0:
-            return self._texts.get(str(text_id), f"txtId {text_id}")
-        return f"txtId {text_id}"
+            text = self._texts.get(text_id)
+            if text is not None:
+                return text
+        return _fallback_txt(text_id)
 
     def get_text_by_type(self, text_type: int) -> str:
         """Return the translated label associated with a tile type."""
         text_id = TXT_ID_BY_TYPE.get(text_type)
         if text_id is None:
-            return f"type {text_type}"
+            return _fallback_type(text_type)
         return self.get_text(text_id)
 
 
+@lru_cache(maxsize=256)
 def get_icon(icon_id: int) -> str:
     """Return the Material Design icon name mapped to ``icon_id``."""
     return ICON_BY_ID.get(icon_id, DEFAULT_ICON)
 
 
+@lru_cache(maxsize=256)
 def get_icon_by_type(icon_type: int) -> str:
     """Return the default icon assigned to the provided tile type."""
     return ICON_BY_TYPE.get(icon_type, DEFAULT_ICON)
@@ -38,13 +38,11 @@ from homeassistant.helpers.typing import StateType, UndefinedType
 
 from . import TechCoordinator, assets
 from .const import (
-    CONTROLLER,
     DOMAIN,
     TYPE_ADDITIONAL_PUMP,
     TYPE_FIRE_SENSOR,
     TYPE_RELAY,
     TYPE_WIDGET,
-    UDID,
     VALUE,
     VISIBILITY,
 )
@@ -52,6 +50,15 @@ from .entity import TileEntity
 
 _LOGGER = logging.getLogger(__name__)
 
+# Tile types backed by :class:`RelaySensor`, mapped to the device class each
+# one is created with. Resolved once here so the setup loop does a single
+# membership test per tile instead of comparing against every type.
+_RELAY_DEVICE_CLASSES: dict[int, binary_sensor.BinarySensorDeviceClass | None] = {
+    TYPE_RELAY: None,
+    TYPE_FIRE_SENSOR: binary_sensor.BinarySensorDeviceClass.MOTION,
+    TYPE_ADDITIONAL_PUMP: None,
+}
+
 
 def _is_contact_widget(widget: dict) -> bool:
     """Return ``True`` for widgets that should be exposed as binary contacts."""
@@ -76,32 +83,25 @@ async def async_setup_entry(
 
     """
     _LOGGER.debug("Setting up entry for sensors…")
-    controller = config_entry.data[CONTROLLER]
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
 
     entities = []
-    # for controller in controllers:
-    controller_udid = controller[UDID]
-    tiles = await coordinator.api.get_module_tiles(controller_udid)
+    tiles = coordinator.tiles
     # _LOGGER.debug("Setting up entry for binary sensors...tiles: %s", tiles)
-    for t in tiles:
-        tile = tiles[t]
+    for tile in tiles.values():
         if tile[VISIBILITY] is False:
             continue
-        if tile[CONF_TYPE] == TYPE_RELAY:
-            entities.append(RelaySensor(tile, coordinator, config_entry))
-        if tile[CONF_TYPE] == TYPE_FIRE_SENSOR:
+        tile_type = tile[CONF_TYPE]
+        if tile_type in _RELAY_DEVICE_CLASSES:
             entities.append(
                 RelaySensor(
                     tile,
                     coordinator,
                     config_entry,
-                    binary_sensor.BinarySensorDeviceClass.MOTION,
+                    _RELAY_DEVICE_CLASSES[tile_type],
                 )
             )
-        if tile[CONF_TYPE] == TYPE_ADDITIONAL_PUMP:
-            entities.append(RelaySensor(tile, coordinator, config_entry))
-        if tile[CONF_TYPE] == TYPE_WIDGET:
+        elif tile_type == TYPE_WIDGET:
             for widget_key in ("widget1", "widget2"):
                 widget = tile.get(CONF_PARAMS, {}).get(widget_key)
                 if widget and _is_contact_widget(widget):
@@ -117,6 +117,8 @@ async def async_setup_entry(
 class TileBinarySensor(TileEntity, binary_sensor.BinarySensorEntity):
     """Base class for Tech tiles that expose binary sensor semantics."""
 
+    __slots__ = ()
+
     _attr_entity_category = EntityCategory.DIAGNOSTIC
 
     def get_state(self, device):
@@ -141,6 +143,8 @@ class TileBinarySensor(TileEntity, binary_sensor.BinarySensorEntity):
 class RelaySensor(TileBinarySensor):
     """Representation of a RelaySensor."""
 
+    __slots__ = ("_coordinator",)
+
     def __init__(
         self, device, coordinator: TechCoordinator, config_entry, device_class=None
     ) -> None:
@@ -174,6 +178,8 @@ class TileWidgetContactSensor(TileBinarySensor):
     Exposed as an opening device-class binary sensor; ``value == 1`` means open.
     """
 
+    __slots__ = ("_widget_key",)
+
     _attr_device_class = binary_sensor.BinarySensorDeviceClass.OPENING
 
     def __init__(
@@ -37,6 +37,23 @@ DEFAULT_MIN_TEMP = 5
 DEFAULT_MAX_TEMP = 35
 SUPPORT_HVAC = [HVACMode.HEAT, HVACMode.OFF]
 
+# HVAC action keyed by the zone's (relayState, algorithm) flags. A relay state
+# without a matching algorithm falls back to _HVAC_ACTION_BY_RELAY_STATE, and
+# anything else (e.g. a missing relay) to HVACAction.OFF.
+_HVAC_ACTION_BY_FLAGS = {
+    (STATE_ON, "heating"): HVACAction.HEATING,
+    (STATE_ON, "cooling"): HVACAction.COOLING,
+}
+_HVAC_ACTION_BY_RELAY_STATE = {
+    STATE_ON: HVACAction.IDLE,
+    STATE_OFF: HVACAction.IDLE,
+}
+# Zone states that mean the zone is actively regulated; all others are off.
+_HVAC_MODE_BY_ZONE_STATE = {
+    "zoneOn": HVACMode.HEAT,
+    "noAlarm": HVACMode.HEAT,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -54,9 +71,9 @@ async def async_setup_entry(
     udid = config_entry.data[CONTROLLER][UDID]
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
     _LOGGER.debug("Setting up entry, controller udid: %s", udid)
-    zones = await coordinator.api.get_module_zones(udid)
     thermostats = [
-        TechThermostat(zones[zone], coordinator, config_entry) for zone in zones
+        TechThermostat(zone, coordinator, config_entry)
+        for zone in coordinator.zones.values()
     ]
 
     async_add_entities(thermostats, True)
@@ -65,8 +82,39 @@ async def async_setup_entry(
 class TechThermostat(ClimateEntity, CoordinatorEntity):
     """Representation of a Tech climate."""
 
+    # Home Assistant's Entity base keeps a ``__dict__`` (its cached properties
+    # live there), so these slots only move the integration's own per-zone
+    # fields out of it; ``_attr_*`` names must stay unslotted.
+    __slots__ = (
+        "_config_entry",
+        "_coordinator",
+        "_enable_turn_on_off_backwards_compatibility",
+        "_humidity",
+        "_id",
+        "_mode",
+        "_state",
+        "_target_temperature",
+        "_temperature",
+        "_udid",
+        "_unique_id",
+        "_zones",
+        "device_name",
+        "manufacturer",
+        "model",
+    )
+
     _attr_has_entity_name = True
     _attr_name = None
+    _attr_supported_features = (
+        ClimateEntityFeature.TARGET_TEMPERATURE
+        | ClimateEntityFeature.TURN_ON
+        | ClimateEntityFeature.TURN_OFF
+    )
+    _attr_hvac_modes = SUPPORT_HVAC
+    _attr_temperature_unit = UnitOfTemperature.CELSIUS
+    _attr_target_temperature_step = 0.1
+    _attr_min_temp = DEFAULT_MIN_TEMP
+    _attr_max_temp = DEFAULT_MAX_TEMP
 
     def __init__(
         self, device, coordinator: TechCoordinator, config_entry: ConfigEntry
@@ -81,23 +129,24 @@ class TechThermostat(ClimateEntity, CoordinatorEntity):
         """
         _LOGGER.debug("Init TechThermostat…")
         super().__init__(coordinator)
+        controller = config_entry.data[CONTROLLER]
+        zone_name = device[CONF_DESCRIPTION][CONF_NAME]
         self._config_entry = config_entry
-        self._udid = config_entry.data[CONTROLLER][UDID]
+        self._udid = controller[UDID]
         self._coordinator = coordinator
+        # ``module_data`` refreshes the API client's per-module cache in
+        # place, so this mapping stays current across coordinator polls.
+        self._zones = coordinator.zones
         self._id = device[CONF_ZONE][CONF_ID]
-        self._unique_id = f"{self._udid}_{device[CONF_ZONE][CONF_ID]}"
+        self._unique_id = f"{self._udid}_{self._id}"
         self.device_name = (
-            device[CONF_DESCRIPTION][CONF_NAME]
-            if not self._config_entry.data.get(INCLUDE_HUB_IN_NAME, False)
-            else f"{self._config_entry.title} {device[CONF_DESCRIPTION][CONF_NAME]}"
+            f"{config_entry.title} {zone_name}"
+            if config_entry.data.get(INCLUDE_HUB_IN_NAME, False)
+            else zone_name
         )
 
         self.manufacturer = MANUFACTURER
-        self.model = (
-            config_entry.data[CONTROLLER][CONF_NAME]
-            + ": "
-            + config_entry.data[CONTROLLER][VER]
-        )
+        self.model = f"{controller[CONF_NAME]}: {controller[VER]}"
         self._temperature = None
         self._target_temperature = None
         self.update_properties(device)
@@ -123,57 +172,49 @@ class TechThermostat(ClimateEntity, CoordinatorEntity):
             device: Zone dictionary retrieved from the Tech API.
 
         """
+        zone = device[CONF_ZONE]
+
         # Update target temperature
-        if device[CONF_ZONE]["setTemperature"] is not None:
-            if device[CONF_ZONE]["duringChange"] is False:
-                self._target_temperature = device[CONF_ZONE]["setTemperature"] / 10
+        set_temperature = zone["setTemperature"]
+        if set_temperature is not None:
+            if zone["duringChange"] is False:
+                self._target_temperature = set_temperature / 10
             else:
                 _LOGGER.debug(
                     "Zone ID %s is duringChange so ignore to update target temperature",
-                    device[CONF_ZONE]["id"],
+                    zone["id"],
                 )
         else:
             self._target_temperature = None
 
         # Update current temperature
-        if device[CONF_ZONE]["currentTemperature"] is not None:
-            self._temperature = device[CONF_ZONE]["currentTemperature"] / 10
-        else:
-            self._temperature = None
+        current_temperature = zone["currentTemperature"]
+        self._temperature = (
+            current_temperature / 10 if current_temperature is not None else None
+        )
 
         # Update humidity
-        if (
-            device[CONF_ZONE]["humidity"] is not None
-            and device[CONF_ZONE]["humidity"] >= 0
-        ):
-            self._humidity = device[CONF_ZONE]["humidity"]
-        else:
-            self._humidity = None
+        humidity = zone["humidity"]
+        self._humidity = humidity if humidity is not None and humidity >= 0 else None
 
         # Update HVAC state
-        state = device[CONF_ZONE]["flags"]["relayState"]
-        hvac_mode = device[CONF_ZONE]["flags"]["algorithm"]
-        if state == STATE_ON:
-            if hvac_mode == "heating":
-                self._state = HVACAction.HEATING
-            elif hvac_mode == "cooling":
-                self._state = HVACAction.COOLING
-        elif state == STATE_OFF:
-            self._state = HVACAction.IDLE
-        else:
-            self._state = HVACAction.OFF
+        flags = zone["flags"]
+        state = flags["relayState"]
+        action = _HVAC_ACTION_BY_FLAGS.get((state, flags["algorithm"]))
+        if action is None:
+            action = _HVAC_ACTION_BY_RELAY_STATE.get(state, HVACAction.OFF)
+        self._state = action
 
         # Update HVAC mode
-        mode = device[CONF_ZONE]["zoneState"]
-        if mode in ("zoneOn", "noAlarm"):
-            self._mode = HVACMode.HEAT
-        else:
-            self._mode = HVACMode.OFF
+        self._mode = _HVAC_MODE_BY_ZONE_STATE.get(zone["zoneState"], HVACMode.OFF)
 
     @callback
     def _handle_coordinator_update(self, *args: Any) -> None:
         """Handle updated data from the coordinator."""
-        self.update_properties(self._coordinator.data["zones"][self._id])
+        zone = self._zones.get(self._id)
+        if zone is None:
+            return
+        self.update_properties(zone)
         self.async_write_ha_state()
 
     @property
@@ -181,15 +222,6 @@ class TechThermostat(ClimateEntity, CoordinatorEntity):
         """Return a unique ID."""
         return f"{self._unique_id}_zone_climate"
 
-    @property
-    def supported_features(self) -> ClimateEntityFeature:
-        """Return the list of supported features."""
-        return (
-            ClimateEntityFeature.TARGET_TEMPERATURE
-            | ClimateEntityFeature.TURN_ON
-            | ClimateEntityFeature.TURN_OFF
-        )
-
     @property
     def hvac_mode(self) -> HVACMode:
         """Return hvac operation ie. heat, cool mode.
@@ -198,14 +230,6 @@ class TechThermostat(ClimateEntity, CoordinatorEntity):
         """
         return self._mode
 
-    @property
-    def hvac_modes(self) -> list[HVACMode]:
-        """Return the list of available hvac operation modes.
-
-        Need to be a subset of HVAC_MODES.
-        """
-        return SUPPORT_HVAC
-
     @property
     def hvac_action(self) -> HVACAction | None:
         """Return the current running hvac operation if supported.
@@ -214,16 +238,6 @@ class TechThermostat(ClimateEntity, CoordinatorEntity):
         """
         return self._state
 
-    @property
-    def temperature_unit(self) -> str:
-        """Return the unit of measurement."""
-        return UnitOfTemperature.CELSIUS
-
-    @property
-    def target_temperature_step(self) -> float | None:
-        """Return the supported step of target temperature."""
-        return 0.1
-
     @property
     def current_temperature(self) -> float | None:
         """Return the current temperature."""
@@ -234,16 +248,6 @@ class TechThermostat(ClimateEntity, CoordinatorEntity):
         """Return current humidity."""
         return self._humidity
 
-    @property
-    def min_temp(self) -> float:
-        """Return the minimal allowed temperature value."""
-        return DEFAULT_MIN_TEMP
-
-    @property
-    def max_temp(self) -> float:
-        """Return the maximum allowed temperature value."""
-        return DEFAULT_MAX_TEMP
-
     @property
     def target_temperature(self) -> float | None:
         """Return the temperature we try to reach."""
@@ -95,12 +95,17 @@ PLATFORMS = [
 # polling, and the boiler tile data does not change faster than ~60s anyway.
 SCAN_INTERVAL: Final = timedelta(seconds=60)
 API_TIMEOUT: Final = 60
+# POST bodies at least this large are gzip-compressed when the client opts in
+# with ``Tech.compress_requests``; smaller ones are not worth the CPU.
+REQUEST_COMPRESS_MIN_SIZE: Final = 1024
 
-# A fetched module payload is reused for this many seconds. The seven HA
-# platforms each call get_module_zones/tiles/menus during setup; without this
-# guard every call would trigger its own full (rate-limited) cloud refresh.
-# The coordinator passes force=True to refresh on its own SCAN_INTERVAL cadence
-# regardless of cache age, so live telemetry is never stale beyond one poll.
+# A fetched module payload is reused for this many seconds. Platforms read
+# zones/tiles/menus straight off the coordinator during setup, but direct API
+# callers (get_module_zones/tiles/menus, get_zone, get_tile) still go through
+# module_data; without this guard each of them would trigger its own full
+# (rate-limited) cloud refresh. The coordinator passes force=True to refresh
+# on its own SCAN_INTERVAL cadence regardless of cache age, so live telemetry
+# is never stale beyond one poll.
 MODULE_DATA_CACHE_TTL: Final = SCAN_INTERVAL.total_seconds()
 
 # ---------------------------------------------------------------------------
@@ -279,21 +284,23 @@ VALUE_FORMAT_MIN_SEC = 3
 VALUE_FORMAT_HOUR_MIN = 4
 VALUE_FORMAT_H_MIN_DAY = 5
 
-TECH_SUPPORTED_LANGUAGES = [
-    "en",
-    "fr",
-    "it",
-    "es",
-    "nl",
-    "pl",
-    "de",
-    "cs",
-    "sk",
-    "hu",
-    "ro",
-    "lt",
-    "et",
-    "ru",
-    "si",
-    "hr",
-]
+TECH_SUPPORTED_LANGUAGES: frozenset[str] = frozenset(
+    {
+        "en",
+        "fr",
+        "it",
+        "es",
+        "nl",
+        "pl",
+        "de",
+        "cs",
+        "sk",
+        "hu",
+        "ro",
+        "lt",
+        "et",
+        "ru",
+        "si",
+        "hr",
+    }
+)
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+from typing import Any
 
 from aiohttp import ClientSession
 
@@ -48,11 +49,28 @@ class TechCoordinator(DataUpdateCoordinator):
         # any platform is set up; the empty default keeps lookups safe.
         self.translations = Translations()
 
+    @property
+    def zones(self) -> dict[int, dict[str, Any]]:
+        """Return the visible zones from the latest refresh, keyed by zone id."""
+        return self.data["zones"]
+
+    @property
+    def tiles(self) -> dict[int, dict[str, Any]]:
+        """Return the visible tiles from the latest refresh, keyed by tile id."""
+        return self.data["tiles"]
+
+    @property
+    def menus(self) -> dict[str, dict[str, Any]]:
+        """Return the menu items from the latest refresh, keyed by menu key."""
+        return self.data["menus"]
+
     async def _async_update_data(self) -> dict:
         """Fetch the latest module data for the configured controller.
 
         Returns:
-            Fresh module payload containing ``zones`` and ``tiles`` data.
+            Fresh module payload containing ``zones`` and ``tiles`` data. This
+            is the API client's per-module cache, whose sub-dicts are updated
+            in place, so entities may hold on to them between refreshes.
 
         Raises:
             ConfigEntryAuthFailed: If the API indicates that the token expired.
@@ -75,6 +75,20 @@ class TileEntity(
     See the module docstring for the naming and device-grouping protocol.
     """
 
+    # Slots for the fields set in ``__init__`` below. Home Assistant's Entity
+    # base still provides a ``__dict__`` for its cached properties, so
+    # subclasses without their own ``__slots__`` keep working unchanged.
+    __slots__ = (
+        "_config_entry",
+        "_id",
+        "_model",
+        "_name",
+        "_state",
+        "_udid",
+        "_unique_id",
+        "manufacturer",
+    )
+
     # _attr_has_entity_name = True tells Home Assistant to compose the final
     # friendly_name as "<device.name> <self._name>". Setting this on the base
     # class means every TileEntity descendant participates in the protocol --
@@ -44,13 +44,10 @@ async def async_setup_entry(
         async_add_entities: Callback to register entities with Home Assistant.
 
     """
-    controller = config_entry.data[CONTROLLER]
     coordinator: TechCoordinator = hass.data[DOMAIN][config_entry.entry_id]
-    controller_udid = controller[UDID]
 
-    menus = await coordinator.api.get_module_menus(controller_udid)
-    zones = await coordinator.api.get_module_zones(controller_udid)
-    ctx = assets.build_menu_context(menus, zones, coordinator.translations)
+    menus = coordinator.menus
+    ctx = assets.build_menu_context(menus, coordinator.zones, coordinator.translations)
 
     entities: list[MenuSelectEntity] = []
     for key, item in menus.items():
@@ -136,8 +136,8 @@ async def async_setup_entry(
     _LOGGER.debug("Setting up sensor entry, controller udid: %s", controller_udid)
 
     coordinator = hass.data[DOMAIN][config_entry.entry_id]
-    zones = await coordinator.api.get_module_zones(controller_udid)
-    tiles = await coordinator.api.get_module_tiles(controller_udid)
+    zones = coordinator.zones
+    tiles = coordinator.tiles
 
     zone_entities = [
         entity
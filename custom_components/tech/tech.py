@@ -3,22 +3,19 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import gzip
 import logging
 import time
-from typing import TYPE_CHECKING, Any
+from typing import Any
 
-from aiohttp import ClientTimeout
-
-if TYPE_CHECKING:  # pragma: no cover - imported for type checking only
-    from aiohttp import ClientSession
-else:  # pragma: no cover
-    ClientSession = Any
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+import orjson
 
 from .const import (
     API_TIMEOUT,
     MENU_TYPES,
     MODULE_DATA_CACHE_TTL,
+    REQUEST_COMPRESS_MIN_SIZE,
     TECH_SUPPORTED_LANGUAGES,
 )
 
@@ -29,6 +26,14 @@ class Tech:
     """Main class to perform Tech API requests."""
 
     TECH_API_URL = "https://emodul.eu/api/v1/"
+    # Bound every request so a stalled cloud connection cannot hang the
+    # config flow or entry setup, which run outside the coordinator timeout.
+    # ClientTimeout is immutable, so one instance is shared by every client.
+    timeout = ClientTimeout(total=API_TIMEOUT)
+    # Opt-in gzip for large POST bodies. Off by default: the eModul API is not
+    # documented to accept compressed requests. Responses are always
+    # requested with ``Accept-Encoding: gzip`` and decompressed by aiohttp.
+    compress_requests = False
 
     def __init__(
         self,
@@ -47,12 +52,11 @@ class Tech:
 
         """
         _LOGGER.debug("Init Tech")
+        # Sent per request rather than set on the session: inside Home
+        # Assistant the session is shared, so it must not carry our token.
         self.headers = {"Accept": "application/json", "Accept-Encoding": "gzip"}
         self.base_url = base_url
         self.session = session
-        # Bound every request so a stalled cloud connection cannot hang the
-        # config flow or entry setup, which run outside the coordinator timeout.
-        self.timeout = ClientTimeout(total=API_TIMEOUT)
         if user_id and token:
             self.user_id = user_id
             self.token = token
@@ -60,19 +64,46 @@ class Tech:
             self.authenticated = True
         else:
             self.authenticated = False
-        # Serialises concurrent module_data refreshes (the platforms set up in
-        # parallel) so they coalesce onto a single fetch instead of stampeding.
-        self.update_lock = asyncio.Lock()
+        # Per-module locks serialise concurrent module_data refreshes of the
+        # same module (the platforms set up in parallel) so they coalesce onto
+        # a single fetch, while different modules refresh independently.
+        self._locks: dict[str, asyncio.Lock] = {}
         self.modules = {}
+        self._translations_cache: dict[str, dict[str, Any]] = {}
+
+    @classmethod
+    def create_session(cls) -> ClientSession:
+        """Return a ``ClientSession`` tuned for polling the eModul cloud.
 
-    async def get(self, request_path: str) -> dict[str, Any]:
+        Every request goes to a single HTTPS host, so the connector keeps a
+        small pool of idle connections alive between polls and caches the
+        DNS lookup, avoiding a fresh TLS handshake on each request. Inside
+        Home Assistant the integration uses the shared session from
+        ``async_get_clientsession`` instead; this helper is for standalone
+        use. Call it from a running event loop and close the session when
+        done.
+
+        Returns:
+            A new ``ClientSession`` owned by the caller.
+
+        """
+        connector = TCPConnector(
+            limit=20,
+            limit_per_host=10,
+            keepalive_timeout=60,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
+        return ClientSession(connector=connector, timeout=cls.timeout)
+
+    async def get(self, request_path: str) -> dict[str, Any] | None:
         """Perform a GET request against the Tech API.
 
         Args:
             request_path: Relative path appended to the base URL.
 
         Returns:
-            Parsed JSON response.
+            Parsed JSON response, or ``None`` for an empty body.
 
         Raises:
             TechError: Raised when the API responds with a non-200 status code.
@@ -83,21 +114,25 @@ class Tech:
         async with self.session.get(
             url, headers=self.headers, timeout=self.timeout
         ) as response:
+            body = await response.read()
             if response.status != 200:
                 _LOGGER.warning("Invalid response from Tech API: %s", response.status)
-                raise TechError(response.status, await response.text())
+                raise TechError(response.status, body.decode(errors="replace"))
 
-            return await response.json()
+            return _loads(body)
 
-    async def post(self, request_path: str, post_data: str) -> dict[str, Any]:
+    async def post(self, request_path: str, post_data: str) -> dict[str, Any] | None:
         """Send a POST request against the Tech API with JSON payload string.
 
+        When :attr:`compress_requests` is set, payloads of at least
+        :data:`const.REQUEST_COMPRESS_MIN_SIZE` characters are sent gzipped.
+
         Args:
             request_path: Relative path appended to the base URL.
             post_data: Raw JSON payload encoded as a string.
 
         Returns:
-            Parsed JSON response.
+            Parsed JSON response, or ``None`` for an empty body.
 
         Raises:
             TechError: Raised when the API responds with a non-200 status code.
@@ -105,14 +140,24 @@ class Tech:
         """
         url = self.base_url + request_path
         _LOGGER.debug("Sending POST request: %s", url)
+        data: str | bytes = post_data
+        headers = self.headers
+        if self.compress_requests and len(post_data) >= REQUEST_COMPRESS_MIN_SIZE:
+            data = gzip.compress(post_data.encode())
+            headers = {
+                **headers,
+                "Content-Encoding": "gzip",
+                "Content-Type": "text/plain; charset=utf-8",
+            }
         async with self.session.post(
-            url, data=post_data, headers=self.headers, timeout=self.timeout
+            url, data=data, headers=headers, timeout=self.timeout
         ) as response:
+            body = await response.read()
             if response.status != 200:
                 _LOGGER.warning("Invalid response from Tech API: %s", response.status)
-                raise TechError(response.status, await response.text())
+                raise TechError(response.status, body.decode(errors="replace"))
 
-            return await response.json()
+            return _loads(body)
 
     async def authenticate(self, username: str, password: str) -> bool:
         """Authenticate the user with the provided credentials.
@@ -129,22 +174,30 @@ class Tech:
 
         """
         path = "authentication"
-        post_data = json.dumps({"username": username, "password": password})
+        post_data = _dumps({"username": username, "password": password})
         try:
             result = await self.post(path, post_data)
             self.authenticated = result["authenticated"]
             if self.authenticated:
                 self.user_id = str(result["user_id"])
                 self.token = result["token"]
-                self.headers = {
-                    "Accept": "application/json",
-                    "Accept-Encoding": "gzip",
-                    "Authorization": f"Bearer {self.token}",
-                }
+                self.headers["Authorization"] = f"Bearer {self.token}"
         except TechError as err:
             raise TechLoginError(401, "Unauthorized") from err
         return result["authenticated"]
 
+    def _module_path(self, module_udid: str) -> str:
+        """Return the API path of ``module_udid`` for the current user.
+
+        Args:
+            module_udid: Tech module identifier.
+
+        Returns:
+            ``users/<user_id>/modules/<module_udid>`` without a trailing slash.
+
+        """
+        return f"users/{self.user_id}/modules/{module_udid}"
+
     async def list_modules(self) -> dict[str, Any]:
         """Return the list of modules available for the authenticated user.
 
@@ -181,7 +234,7 @@ class Tech:
         """
         _LOGGER.debug("Getting module data...  %s", module_udid)
         if self.authenticated:
-            path = f"users/{self.user_id}/modules/{module_udid}"
+            path = self._module_path(module_udid)
             result = await self.get(path)
         else:
             raise TechError(401, "Unauthorized")
@@ -191,6 +244,8 @@ class Tech:
         """Retrieve the translation pack for ``language``.
 
         If the requested language is unsupported, ``en`` will be used.
+        Packs are static for the lifetime of the client, so each language
+        is fetched once and then served from memory.
 
         Args:
             language: Two-letter language code.
@@ -207,6 +262,10 @@ class Tech:
             _LOGGER.debug("Language %s not supported. Switching to default", language)
             language = "en"
 
+        cached = self._translations_cache.get(language)
+        if cached is not None:
+            return cached
+
         _LOGGER.debug("Getting %s language", language)
 
         if self.authenticated:
@@ -214,11 +273,19 @@ class Tech:
             result = await self.get(path)
         else:
             raise TechError(401, "Unauthorized")
+        self._translations_cache[language] = result
         return result
 
+    def clear_translations_cache(self) -> None:
+        """Drop cached translation packs so the next lookup refetches them."""
+        self._translations_cache.clear()
+
     async def get_module_zones(self, module_udid: str) -> dict[int, dict[str, Any]]:
         """Return the cached zones dictionary for ``module_udid``.
 
+        Legacy shim over :meth:`module_data`, which refreshes zones, tiles
+        and menus together and is the preferred entry point.
+
         Args:
             module_udid: Tech module identifier.
 
@@ -233,6 +300,9 @@ class Tech:
     async def get_module_tiles(self, module_udid: str) -> dict[int, dict[str, Any]]:
         """Return the cached tiles dictionary for ``module_udid``.
 
+        Legacy shim over :meth:`module_data`, which refreshes zones, tiles
+        and menus together and is the preferred entry point.
+
         Args:
             module_udid: Tech module identifier.
 
@@ -249,71 +319,82 @@ class Tech:
     ) -> dict[str, Any]:
         """Refresh module zones, tiles and menus and return the cached payload.
 
-        Concurrent callers are serialised through :attr:`update_lock`, and a
+        This is the preferred way to refresh a module: one fetch fills all
+        three caches. Concurrent callers for the same module are serialised
+        through a per-module lock (other modules refresh in parallel), and a
         payload fetched within :data:`const.MODULE_DATA_CACHE_TTL` seconds is
         reused as-is. This collapses the burst of per-platform setup calls onto
         a single cloud refresh instead of one full (rate-limited) fetch each.
         The coordinator passes ``force=True`` to refresh on its own polling
         cadence regardless of cache age.
 
+        A caller that queued on the lock while another caller's fetch started
+        shares that fetch's result, even with ``force=True``: the payload was
+        requested after the call was made, so it is as fresh as a refetch.
+
         Args:
             module_udid: Tech module identifier.
-            force: When ``True``, bypass the freshness check and always refetch.
+            force: When ``True``, bypass the TTL check and refetch unless a
+                fetch started after this call was made.
 
         Returns:
             Dictionary containing ``zones``, ``tiles`` and ``menus`` entries.
 
         """
-        async with self.update_lock:
+        requested_at = time.monotonic()
+        lock = self._locks.get(module_udid)
+        if lock is None:
+            lock = self._locks[module_udid] = asyncio.Lock()
+        async with lock:
             cache = self.modules.setdefault(
                 module_udid,
                 {"last_update": None, "zones": {}, "tiles": {}, "menus": {}},
             )
 
+            # ``last_update`` records when the cached payload's fetch started.
             last_update = cache.get("last_update")
-            if (
-                not force
-                and last_update is not None
-                and time.monotonic() - last_update < MODULE_DATA_CACHE_TTL
+            if (last_update is not None and last_update >= requested_at) or (
+                not force and self._fresh_module(module_udid)
             ):
                 _LOGGER.debug("Reusing cached module data for %s", module_udid)
                 return cache
 
             _LOGGER.debug("Updating module zones & tiles ... %s", module_udid)
+            fetch_started = time.monotonic()
             result = await self.get_module_data(module_udid)
 
-            raw_zones = result.get("zones", {}).get("elements", [])
-            visible_zones = [
-                zone
-                for zone in raw_zones
-                if zone
-                and zone.get("zone")
-                and zone["zone"].get("visibility")
-                and zone["zone"].get("zoneState") != "zoneUnregistered"
-            ]
-
-            if visible_zones:
+            # Filter and store in one pass; the cached dicts are updated in
+            # place so entities holding a reference see the new payloads.
+            zones = cache["zones"]
+            zone_count = 0
+            for zone in result.get("zones", {}).get("elements", []):
+                if not zone:
+                    continue
+                inner = zone.get("zone")
+                if (
+                    inner
+                    and inner.get("visibility")
+                    and inner.get("zoneState") != "zoneUnregistered"
+                ):
+                    zones[inner["id"]] = zone
+                    zone_count += 1
+
+            if zone_count:
                 _LOGGER.debug(
-                    "Updating %s zones for controller: %s",
-                    len(visible_zones),
-                    module_udid,
-                )
-                cache["zones"].update(
-                    {zone["zone"]["id"]: zone for zone in visible_zones}
+                    "Updated %s zones for controller: %s", zone_count, module_udid
                 )
 
-            raw_tiles = result.get("tiles", [])
-            visible_tiles = [
-                tile for tile in raw_tiles if tile and tile.get("visibility")
-            ]
+            tiles = cache["tiles"]
+            tile_count = 0
+            for tile in result.get("tiles", []):
+                if tile and tile.get("visibility"):
+                    tiles[tile["id"]] = tile
+                    tile_count += 1
 
-            if visible_tiles:
+            if tile_count:
                 _LOGGER.debug(
-                    "Updating %s tiles for controller: %s",
-                    len(visible_tiles),
-                    module_udid,
+                    "Updated %s tiles for controller: %s", tile_count, module_udid
                 )
-                cache["tiles"].update({tile["id"]: tile for tile in visible_tiles})
 
             menu_items = await self._fetch_menu_data(module_udid)
             if menu_items:
@@ -324,9 +405,49 @@ class Tech:
                 )
                 cache.setdefault("menus", {}).update(menu_items)
 
-            cache["last_update"] = time.monotonic()
+            cache["last_update"] = fetch_started
             return cache
 
+    async def refresh_all(self, module_udids: list[str], force: bool = False) -> None:
+        """Refresh several modules concurrently via :meth:`module_data`.
+
+        Each module has its own lock, so the fetches overlap instead of
+        running one after another.
+
+        Args:
+            module_udids: Tech module identifiers to refresh.
+            force: Passed through to :meth:`module_data`.
+
+        """
+        await asyncio.gather(
+            *(self.module_data(module_udid, force) for module_udid in module_udids)
+        )
+
+    def _fresh_module(self, module_udid: str) -> dict[str, Any] | None:
+        """Return the cached payload for ``module_udid`` if it is still fresh.
+
+        This is the :data:`const.MODULE_DATA_CACHE_TTL` check used by
+        :meth:`module_data`; single-item accessors also call it directly to
+        skip :meth:`module_data` (and its lock) while the cache is fresh.
+
+        Args:
+            module_udid: Tech module identifier.
+
+        Returns:
+            The cached module payload, or ``None`` if missing or stale.
+
+        """
+        cache = self.modules.get(module_udid)
+        if cache is None:
+            return None
+        last_update = cache.get("last_update")
+        if (
+            last_update is None
+            or time.monotonic() - last_update >= MODULE_DATA_CACHE_TTL
+        ):
+            return None
+        return cache
+
     async def _fetch_menu_data(self, module_udid: str) -> dict[str, dict[str, Any]]:
         """Fetch menu items from all configured menu types.
 
@@ -338,9 +459,10 @@ class Tech:
 
         """
         items: dict[str, dict[str, Any]] = {}
+        menu_path = self._module_path(module_udid) + "/menu/"
         for menu_type in MENU_TYPES:
             try:
-                path = f"users/{self.user_id}/modules/{module_udid}/menu/{menu_type}/"
+                path = f"{menu_path}{menu_type}/"
                 result = await self.get(path)
                 elements = result.get("data", {}).get("elements", [])
                 for element in elements:
@@ -390,11 +512,9 @@ class Tech:
         """
         _LOGGER.debug("Setting menu value for %s/%s: %s", menu_type, ido, data)
         if self.authenticated:
-            path = (
-                f"users/{self.user_id}/modules/{module_udid}/menu/{menu_type}/ido/{ido}"
-            )
-            result = await self.post(path, json.dumps(data))
-            _LOGGER.debug(result)
+            path = f"{self._module_path(module_udid)}/menu/{menu_type}/ido/{ido}"
+            result = await self.post(path, _dumps(data))
+            _LOGGER.debug("Menu value set result: %s", result)
         else:
             raise TechError(401, "Unauthorized")
         return result
@@ -409,9 +529,15 @@ class Tech:
         Returns:
             Cached zone dictionary.
 
+        Raises:
+            KeyError: If the module has no visible zone ``zone_id``.
+
         """
-        await self.get_module_zones(module_udid)
-        return self.modules[module_udid]["zones"][zone_id]
+        module = self._fresh_module(module_udid) or await self.module_data(module_udid)
+        zone = module["zones"].get(zone_id)
+        if zone is None:
+            raise KeyError(f"Zone {zone_id} not found in module {module_udid}")
+        return zone
 
     async def get_tile(self, module_udid, tile_id):
         """Return a single tile payload.
@@ -423,9 +549,15 @@ class Tech:
         Returns:
             Cached tile dictionary.
 
+        Raises:
+            KeyError: If the module has no visible tile ``tile_id``.
+
         """
-        await self.get_module_tiles(module_udid)
-        return self.modules[module_udid]["tiles"][tile_id]
+        module = self._fresh_module(module_udid) or await self.module_data(module_udid)
+        tile = module["tiles"].get(tile_id)
+        if tile is None:
+            raise KeyError(f"Tile {tile_id} not found in module {module_udid}")
+        return tile
 
     async def set_const_temp(self, module_udid, zone_id, target_temp):
         """Set the constant temperature of a zone.
@@ -438,13 +570,19 @@ class Tech:
         Returns:
             Parsed JSON response from the API.
 
+        Raises:
+            KeyError: If ``zone_id`` is not in the module's cached zones.
+
         """
         _LOGGER.debug("Setting zone constant temperature…")
         if self.authenticated:
-            path = f"users/{self.user_id}/modules/{module_udid}/zones"
+            path = self._module_path(module_udid) + "/zones"
+            zone = self.modules[module_udid]["zones"].get(zone_id)
+            if zone is None:
+                raise KeyError(f"Zone {zone_id} not found in module {module_udid}")
             data = {
                 "mode": {
-                    "id": self.modules[module_udid]["zones"][zone_id]["mode"]["id"],
+                    "id": zone["mode"]["id"],
                     "parentId": zone_id,
                     "mode": "constantTemp",
                     "constTempTime": 60,
@@ -452,9 +590,9 @@ class Tech:
                     "scheduleIndex": 0,
                 }
             }
-            _LOGGER.debug(data)
-            result = await self.post(path, json.dumps(data))
-            _LOGGER.debug(result)
+            _LOGGER.debug("Sending temperature data: %s", data)
+            result = await self.post(path, _dumps(data))
+            _LOGGER.debug("Temperature set result: %s", result)
         else:
             raise TechError(401, "Unauthorized")
         return result
@@ -473,16 +611,36 @@ class Tech:
         """
         _LOGGER.debug("Turing zone on/off: %s", on)
         if self.authenticated:
-            path = f"users/{self.user_id}/modules/{module_udid}/zones"
+            path = self._module_path(module_udid) + "/zones"
             data = {"zone": {"id": zone_id, "zoneState": "zoneOn" if on else "zoneOff"}}
-            _LOGGER.debug(data)
-            result = await self.post(path, json.dumps(data))
-            _LOGGER.debug(result)
+            _LOGGER.debug("Sending zone state data: %s", data)
+            result = await self.post(path, _dumps(data))
+            _LOGGER.debug("Zone state result: %s", result)
         else:
             raise TechError(401, "Unauthorized")
         return result
 
 
+def _dumps(data: Any) -> str:
+    """Serialise ``data`` to the compact JSON string sent as a POST body.
+
+    The body stays a ``str`` so aiohttp keeps sending it with the same
+    ``text/plain`` content type the API has always received.
+    """
+    return orjson.dumps(data).decode()
+
+
+def _loads(body: bytes) -> Any:
+    """Parse a JSON response body, returning ``None`` when it is empty.
+
+    Matches ``ClientResponse.json()``, which the client used before, so a
+    write the API acknowledges with an empty 200 body does not raise.
+    """
+    if not body.strip():
+        return None
+    return orjson.loads(body)
+
+
 class TechError(Exception):
     """Raised when a Tech API request results in an error."""
 
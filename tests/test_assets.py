@@ -93,6 +93,13 @@ def test_empty_catalog_degrades_to_fallback() -> None:
     assert translations.get_text(100) == "txtId 100"
 
 
+def test_fallback_strings_are_shared() -> None:
+    """Repeated misses for the same id return the same placeholder object."""
+    translations = assets.Translations()
+    assert translations.get_text(101) is translations.get_text(101)
+    assert translations.get_text_by_type(9999) is translations.get_text_by_type(9999)
+
+
 def test_get_text_by_type_resolves_mapped_type() -> None:
     """A tile type mapped in TXT_ID_BY_TYPE resolves via the catalog."""
     fan_txt_id = const.TXT_ID_BY_TYPE[const.TYPE_FAN]
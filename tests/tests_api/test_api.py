@@ -5,13 +5,19 @@ This is a "live" test using real API and Tech provided demo account
 
 """
 
+import asyncio
+import gzip
 import json
 import logging
+import time
 from unittest.mock import AsyncMock, patch
 
 import aiohttp
+from aioresponses import aioresponses
 import pytest
+from yarl import URL
 
+from custom_components.tech.const import REQUEST_COMPRESS_MIN_SIZE
 from custom_components.tech.tech import Tech, TechError, TechLoginError
 
 logging.basicConfig(level=logging.INFO)
@@ -725,3 +731,174 @@ class TestTechAPI:
 
             # Verify that the method returns the response
             assert result == mock_set_const_temp_response
+
+    @pytest.mark.asyncio
+    async def test_module_data_coalesces_concurrent_calls(
+        self, client_session: aiohttp.ClientSession
+    ):
+        """Test that queued module_data() callers share a fetch started after them."""
+        module_udid = "123456789"
+        fetches = 0
+
+        async def slow_module_data(_self, _udid):
+            nonlocal fetches
+            fetches += 1
+            await asyncio.sleep(0.01)
+            return {"zones": {"elements": []}, "tiles": []}
+
+        with (
+            patch.object(Tech, "get_module_data", slow_module_data),
+            patch.object(Tech, "_fetch_menu_data", new_callable=AsyncMock) as menus,
+        ):
+            menus.return_value = {}
+            instance = Tech(client_session, "user123", "token")
+
+            await asyncio.gather(
+                *(instance.module_data(module_udid, force=True) for _ in range(4))
+            )
+
+            # The first call fetches alone; the three callers queued behind it
+            # share the single fetch started after they asked.
+            assert fetches == 2
+
+            await instance.module_data(module_udid)
+            assert fetches == 2, "A fresh cache should be reused"
+
+    @pytest.mark.asyncio
+    async def test_module_data_does_not_coalesce_across_modules(
+        self, client_session: aiohttp.ClientSession
+    ):
+        """Test that refresh_all() refreshes different modules concurrently."""
+        in_flight = 0
+        peak = 0
+
+        async def slow_module_data(_self, _udid):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return {"zones": {"elements": []}, "tiles": []}
+
+        with (
+            patch.object(Tech, "get_module_data", slow_module_data),
+            patch.object(Tech, "_fetch_menu_data", new_callable=AsyncMock) as menus,
+        ):
+            menus.return_value = {}
+            instance = Tech(client_session, "user123", "token")
+
+            await instance.refresh_all(["module_a", "module_b"], force=True)
+
+            assert peak == 2
+            assert set(instance.modules) == {"module_a", "module_b"}
+
+    @pytest.mark.asyncio
+    async def test_get_translations_cached_mock(
+        self, client_session: aiohttp.ClientSession
+    ):
+        """Test that get_translations() fetches each language pack once."""
+        pack = {"status": "success", "data": {"100": "Pompa"}}
+
+        with patch.object(Tech, "get", new_callable=AsyncMock) as mock_get:
+            mock_get.return_value = pack
+            instance = Tech(client_session, "user123", "token")
+
+            assert await instance.get_translations("pl") == pack
+            assert await instance.get_translations("pl") == pack
+            assert mock_get.await_count == 1
+
+            instance.clear_translations_cache()
+            await instance.get_translations("pl")
+            assert mock_get.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_response_body_mock(
+        self, client_session: aiohttp.ClientSession
+    ):
+        """Test that an empty 200 body is returned as None instead of raising."""
+        instance = Tech(client_session, "user123", "token")
+        path = "users/user123/modules/123456789/zones"
+
+        with aioresponses() as mocked:
+            mocked.post(instance.base_url + path, body="")
+            mocked.get(instance.base_url + path, body=" \n")
+
+            assert await instance.post(path, "{}") is None
+            assert await instance.get(path) is None
+
+    @pytest.mark.asyncio
+    async def test_post_compression_mock(self, client_session: aiohttp.ClientSession):
+        """Test that post() gzips large bodies only when compress_requests is set."""
+        instance = Tech(client_session, "user123", "token")
+        original_headers = dict(instance.headers)
+        path = "users/user123/modules/123456789/zones"
+        url = instance.base_url + path
+        large = json.dumps({"data": "x" * REQUEST_COMPRESS_MIN_SIZE})
+        small = json.dumps({"data": "x"})
+
+        with aioresponses() as mocked:
+            mocked.post(url, payload={}, repeat=True)
+
+            instance.compress_requests = True
+            await instance.post(path, large)
+            await instance.post(path, small)
+            instance.compress_requests = False
+            await instance.post(path, large)
+
+            calls = mocked.requests[("POST", URL(url))]
+
+        compressed, below_threshold, disabled = (call.kwargs for call in calls)
+        assert gzip.decompress(compressed["data"]).decode() == large
+        assert compressed["headers"]["Content-Encoding"] == "gzip"
+        assert compressed["headers"]["Content-Type"] == "text/plain; charset=utf-8"
+        assert instance.headers == original_headers
+
+        assert below_threshold["data"] == small
+        assert "Content-Encoding" not in below_threshold["headers"]
+        assert disabled["data"] == large
+        assert "Content-Encoding" not in disabled["headers"]
+
+    @pytest.mark.asyncio
+    async def test_get_zone_and_tile_use_fresh_cache_mock(
+        self, client_session: aiohttp.ClientSession
+    ):
+        """Test that get_zone()/get_tile() skip module_data() while the cache is fresh."""
+        module_udid = "123456789"
+        zone = {"zone": {"id": 1}}
+        tile = {"id": 2}
+
+        with patch.object(Tech, "module_data", new_callable=AsyncMock) as mock_refresh:
+            instance = Tech(client_session, "user123", "token")
+            instance.modules[module_udid] = {
+                "last_update": time.monotonic(),
+                "zones": {1: zone},
+                "tiles": {2: tile},
+                "menus": {},
+            }
+
+            assert await instance.get_zone(module_udid, 1) is zone
+            assert await instance.get_tile(module_udid, 2) is tile
+            mock_refresh.assert_not_awaited()
+            assert module_udid not in instance._locks
+
+            # A stale cache goes back through module_data().
+            instance.modules[module_udid]["last_update"] = None
+            mock_refresh.return_value = instance.modules[module_udid]
+            assert await instance.get_zone(module_udid, 1) is zone
+            mock_refresh.assert_awaited_once_with(module_udid)
+
+    @pytest.mark.asyncio
+    async def test_create_session(self):
+        """Test that create_session() returns a keep-alive tuned session."""
+        session = Tech.create_session()
+        try:
+            connector = session.connector
+            assert isinstance(connector, aiohttp.TCPConnector)
+            assert connector.limit == 20
+            assert connector.limit_per_host == 10
+            assert not connector.force_close, "Connections should be kept alive"
+            assert connector._keepalive_timeout == 60
+            assert connector.use_dns_cache
+            assert session.timeout is Tech.timeout
+        finally:
+            await session.close()